@@ -1,50 +1,111 @@
 import os
-from fastapi import APIRouter, Body, HTTPException, UploadFile
-from fastapi.responses import FileResponse, JSONResponse
+import stat
+import asyncio
+from email.utils import formatdate
+from fastapi import APIRouter, Body, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pathlib import Path
+from utils.function import Function
 from core.logger import logger
-import shutil
 
 router = APIRouter(prefix="/api/v1/chat/background", tags=["Chat Character"])
 
-BACKGROUND_DIR = Path(os.path.join("game_data","backgrounds"))
-ALLOWED_EXTENSIONS = {'.jpg', '.png', '.webp', '.bmp', '.svg', '.tif', '.gif'}
+BACKGROUND_DIR_STR = "game_data/backgrounds"
+BACKGROUND_DIR = Path(BACKGROUND_DIR_STR)
+ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.svg', '.tif', '.gif'}
+
+# /list 的结果缓存，以背景目录的 st_mtime_ns 作为失效依据
+_list_cache = {"dir_mtime_ns": 0, "payload": None}
+_list_cache_lock = asyncio.Lock()
+
+# 文件名里出现这些字符就可能越出背景目录，直接拒绝，不必再做任何系统调用
+_UNSAFE_NAME_CHARS = ('/', '\\', ':', '\0')
+
+def _stat_background(background_file: str):
+    """stat 背景文件，文件不存在或文件名不安全时返回 None"""
+    # 只按文件名拦截路径穿越，不再 resolve()/is_relative_to 校验真实路径：
+    # 背景目录里的符号链接即使指向目录外，也会被正常返回
+    if background_file in ('', '.', '..') or any(c in background_file for c in _UNSAFE_NAME_CHARS):
+        return None
+
+    file_path = f"{BACKGROUND_DIR_STR}/{background_file}"
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        # 文件不存在、文件名过长或含非法字符、无权限等，一律按找不到处理
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+
+    return file_path, file_stat
 
 @router.get("/background_file/{background_file}")
 async def get_specific_avatar(background_file: str):
-    file_path = os.path.join("game_data", "backgrounds", background_file)
-    if not os.path.exists(file_path):
+    # stat 放到线程里，网络盘等慢速存储上也不会卡住事件循环
+    found = await asyncio.to_thread(_stat_background, background_file)
+    if found is None:
         raise HTTPException(status_code=404, detail="Background not found")
-    
-    return FileResponse(file_path)
+
+    file_path, file_stat = found
+    # 传入已有的 stat 结果，FileResponse 会据此设置 Last-Modified/ETag 而不再重复 stat
+    return FileResponse(file_path, stat_result=file_stat)
+
+def _scan_backgrounds(backgrounds_dir: str) -> dict:
+    background_files = []
+    with os.scandir(backgrounds_dir) as it:
+        for entry in it:
+            filename = entry.name
+            # 只取扩展名做集合查找；素材文件名通常已是小写，只有未命中时才转小写再查
+            dot = filename.rfind('.')
+            if dot < 0:
+                continue
+            ext = filename[dot:]
+            if ext not in ALLOWED_EXTENSIONS and ext.lower() not in ALLOWED_EXTENSIONS:
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+
+            title = filename[:dot] or filename
+
+            background_files.append({
+                "image_path": filename,
+                "title": title,
+                "modified_time": entry.stat().st_mtime
+            })
+
+    background_files.sort(key=lambda x: x["modified_time"], reverse=True)
+
+    if not background_files:
+        return {"data": [], "message": "背景图片一个都没找到"}
+
+    return {"data": background_files}
 
 @router.get("/list")
-async def list_all_backgrounds():
+async def list_all_backgrounds(request: Request):
     try:
-        backgrounds_dir = os.path.join("game_data", "backgrounds")
-        if not os.path.exists(backgrounds_dir):
+        try:
+            dir_stat = os.stat(BACKGROUND_DIR_STR)
+        except FileNotFoundError:
             return {"data": [], "message": "背景图片的目录没有找到"}
-        
-        background_files = []
-        for filename in os.listdir(backgrounds_dir):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-                file_path = os.path.join(backgrounds_dir, filename)
-                stat = os.stat(file_path)
-                
-                title = os.path.splitext(filename)[0]
-                
-                background_files.append({
-                    "image_path": filename,
-                    "title": title,
-                    "modified_time": stat.st_mtime
-                })
-        
-        background_files.sort(key=lambda x: x["modified_time"], reverse=True)
 
-        if not background_files:
-            return {"data": [], "message": "背景图片一个都没找到"}
+        # 目录的 mtime 在增删改名文件时都会变化，可以直接作为缓存版本号
+        dir_mtime_ns = dir_stat.st_mtime_ns
+        # no-cache：浏览器每次都带 If-None-Match 回来验证，列表没变时只拿到 304
+        headers = {
+            "Cache-Control": "no-cache",
+            "ETag": f'"{dir_mtime_ns:x}"',
+            "Last-Modified": formatdate(dir_stat.st_mtime, usegmt=True),
+        }
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
 
-        return {"data": background_files}
+        async with _list_cache_lock:
+            if _list_cache["payload"] is None or _list_cache["dir_mtime_ns"] != dir_mtime_ns:
+                _list_cache["payload"] = await asyncio.to_thread(_scan_backgrounds, BACKGROUND_DIR_STR)
+                _list_cache["dir_mtime_ns"] = dir_mtime_ns
+            payload = _list_cache["payload"]
+
+        return JSONResponse(content=payload, headers=headers)
 
     except Exception as e:
         logger.error(f"获取背景列表失败: {str(e)}")
@@ -65,8 +126,10 @@ async def upload_music(file: UploadFile, name: str = None):
         filename = name if name else file.filename
         save_path = BACKGROUND_DIR / filename
         
-        with save_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(Function.save_upload_file, file.file, save_path)
+
+        # 覆盖同名文件不会改变目录的 mtime，手动刷新一下让列表缓存失效
+        await asyncio.to_thread(os.utime, BACKGROUND_DIR)
         
         return JSONResponse(
             status_code=200,
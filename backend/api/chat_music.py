@@ -1,9 +1,11 @@
 import os
-from fastapi import APIRouter, UploadFile, HTTPException
+import asyncio
+import aiofiles
+from fastapi import APIRouter, UploadFile, HTTPException, Request
 from fastapi.responses import JSONResponse, FileResponse
 from pathlib import Path
+from utils.function import Function
 from typing import List, Dict
-import shutil
 
 router = APIRouter(prefix="/api/v1/chat/back-music", tags=["Background Music"])
 
@@ -57,8 +59,43 @@ async def upload_music(file: UploadFile, name: str = None):
         filename = name if name else file.filename
         save_path = MUSIC_DIR / filename
         
-        with save_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(Function.save_upload_file, file.file, save_path)
+        
+        return JSONResponse(
+            status_code=200,
+            content={"message": "音乐上传成功"}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"未能上传音乐: {str(e)}")
+
+@router.post("/upload_stream")
+async def upload_music_stream(request: Request, filename: str, name: str = None):
+    """
+    以原始请求体流式上传一个音乐文件，边收边写，内存占用与文件大小无关
+    """
+    try:
+        # 校验的必须是最终写入的文件名，否则 name 可以绕过扩展名检查
+        save_name = Path(name if name else filename).name
+        file_ext = Path(save_name).suffix.lower()
+        if file_ext not in ALLOWED_EXTENSIONS:
+            raise HTTPException(status_code=400, detail="无效文件类型")
+        
+        MUSIC_DIR.mkdir(parents=True, exist_ok=True)
+        
+        save_path = MUSIC_DIR / save_name
+        # 先写到临时文件，传输完成后再替换，避免中断时覆盖或删掉已有的同名音乐
+        tmp_path = save_path.with_name(save_path.name + ".part")
+        
+        try:
+            async with aiofiles.open(tmp_path, "wb") as buffer:
+                async for chunk in request.stream():
+                    await buffer.write(chunk)
+            os.replace(tmp_path, save_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
         return JSONResponse(
             status_code=200,
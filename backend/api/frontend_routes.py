@@ -8,38 +8,63 @@ router = APIRouter()
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 frontend_dir = os.path.join(root_dir, 'frontend', 'public')
 
-# ✅ 自定义 StaticFiles（禁用缓存）
-class NoCacheStaticFiles(StaticFiles):
-    async def get_response(self, path: str, scope):
-        response = await super().get_response(path, scope)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
+INDEX_HTML = os.path.join(frontend_dir, "pages", "index.html")
+ABOUT_HTML = os.path.join(frontend_dir, "pages", "about.html")
+SETTINGS_HTML = os.path.join(frontend_dir, "pages", "settings.html")
+
+_NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0"
+}
+
+_NO_CACHE_HEADER_NAMES = {name.lower().encode("latin-1") for name in _NO_CACHE_HEADERS}
+_NO_CACHE_RAW_HEADERS = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in _NO_CACHE_HEADERS.items()
+]
+
+# ✅ 禁用缓存的 ASGI 中间件（API 路由除外）
+# 直接改写 http.response.start 消息里的原始 header 列表，不用为每个响应构造 Headers 对象
+class NoCacheMiddleware:
+    def __init__(self, app, exclude_prefix: str = "/api"):
+        self.app = app
+        self.exclude_prefix = exclude_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_no_cache(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    header for header in message.get("headers", [])
+                    if header[0].lower() not in _NO_CACHE_HEADER_NAMES
+                ]
+                headers.extend(_NO_CACHE_RAW_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_no_cache)
 
 # ✅ 托管所有静态资源（保持原有路径结构）
 # 注意：这里改为返回 StaticFiles 实例，由上层 app.mount() 调用
 def get_static_files():
-    return NoCacheStaticFiles(directory=frontend_dir)
+    return StaticFiles(directory=frontend_dir)
 
 # ✅ 保持原有HTML路由
 def get_file_response(file_path: str) -> FileResponse:
-    response = FileResponse(file_path)
-    response.headers.update({
-        "Cache-Control": "no-cache, no-store, must-revalidate",
-        "Pragma": "no-cache",
-        "Expires": "0"
-    })
-    return response
+    return FileResponse(file_path, headers=_NO_CACHE_HEADERS)
 
 @router.get("/")
 async def index():
-    return get_file_response(os.path.join(frontend_dir, "pages", "index.html"))
+    return get_file_response(INDEX_HTML)
 
 @router.get("/about")
 async def about():
-    return get_file_response(os.path.join(frontend_dir, "pages", "about.html"))
+    return get_file_response(ABOUT_HTML)
 
 @router.get("/settings")
 async def settings():
-    return get_file_response(os.path.join(frontend_dir, "pages", "settings.html"))
\ No newline at end of file
+    return get_file_response(SETTINGS_HTML)
\ No newline at end of file
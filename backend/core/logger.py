@@ -33,7 +33,9 @@ class Logger:
     
     DEFAULT_ANIMATION_STYLE = 'braille'
     DEFAULT_ANIMATION_COLOR = TermColors.WHITE
+    ANIMATION_INTERVAL = 0.12
     DATE_FORMAT = "%Y-%m-%d-%H:%M:%S"
+    _ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
     
     ANIMATION_STYLES = {
         'braille': ['⢿', '⣻', '⣽', '⣾', '⣷', '⣯', '⣟', '⡿'],
@@ -132,6 +134,13 @@ class Logger:
         console_handler = self._create_console_handler()
         self._logger.addHandler(console_handler)
 
+        # 提前绑定底层 logger 的方法，日志调用时省去一次属性查找
+        self._log_debug = self._logger.debug
+        self._log_info = self._logger.info
+        self._log_warning = self._logger.warning
+        self._log_error = self._logger.error
+        self._log_critical = self._logger.critical
+
     def _create_console_handler(self) -> logging.Handler:
         """创建控制台日志处理器"""
         handler = AnimationAwareStreamHandler(sys.stdout)
@@ -165,27 +174,27 @@ class Logger:
 
     def debug(self, message: str, exc_info: bool = False):
         """记录调试级别日志"""
-        self._logger.debug(message, exc_info=exc_info)
+        self._log_debug(message, exc_info=exc_info)
 
     def info(self, message: str, exc_info: bool = False):
         """记录信息级别日志"""
-        self._logger.info(message, exc_info=exc_info)
+        self._log_info(message, exc_info=exc_info)
 
     def warning(self, message: str, exc_info: bool = False):
         """记录警告级别日志"""
-        self._logger.warning(message, exc_info=exc_info)
+        self._log_warning(message, exc_info=exc_info)
 
     def error(self, message: str, exc_info: bool = False):
         """记录错误级别日志"""
-        self._logger.error(message, exc_info=exc_info)
+        self._log_error(message, exc_info=exc_info)
 
     def critical(self, message: str, exc_info: bool = False):
         """记录严重错误级别日志"""
-        self._logger.critical(message, exc_info=exc_info)
+        self._log_critical(message, exc_info=exc_info)
 
     def info_color(self, message: str, color: str = TermColors.GREEN, exc_info: bool = False):
         """使用自定义颜色输出信息"""
-        print(f"{color}[INFO]: {message}{TermColors.RESET}")
+        sys.stdout.write(f"{color}[INFO]: {message}{TermColors.RESET}\n")
 
     def start_loading_animation(self,message: str = "Processing",animation_style: str = DEFAULT_ANIMATION_STYLE,color: str = DEFAULT_ANIMATION_COLOR):
         """动画控制方法"""
@@ -200,17 +209,18 @@ class Logger:
                 self.ANIMATION_STYLES[self.DEFAULT_ANIMATION_STYLE]
             )
 
-            initial_char = animation_chars[0]
-            initial_line = f"{color}{message} {initial_char}{TermColors.RESET} "
-            stripped_line = self._strip_ansi_codes(initial_line)
-            initial_width = self._wcswidth(stripped_line)
+            # 颜色码是自己拼上去的，不用再剥离；只有外部传入的 message 可能带转义码
+            # 可见部分为 "{message} {char} "，动画期间只有旋转字符在变
+            fixed_width = self._wcswidth(self._strip_ansi_codes(message)) + 2
+            char_widths = tuple(self._wcswidth(char) for char in animation_chars)
+            initial_width = fixed_width + char_widths[0]
 
             self._is_animating = True
             self._current_animation_line_width = initial_width
 
             self._animation_thread = threading.Thread(
                 target=self._animate,
-                args=(message, animation_chars, color),
+                args=(message, animation_chars, color, fixed_width, char_widths),
                 daemon=True
             )
             self._animation_thread.start()
@@ -247,47 +257,55 @@ class Logger:
         else:
             self.error(f"{TermColors.RED}✖{TermColors.RESET} {message}")
 
-    def _animate(self, message: str, animation_chars: List[str], color: str):
+    def _animate(self, message: str, animation_chars: List[str], color: str,
+                 fixed_width: int, char_widths: tuple):
         """动画线程主函数"""
+        # 每一帧的内容和宽度在动画开始时一次性生成，循环里只做写入
+        frames = [f"\r{color}{message} {char}{TermColors.RESET} " for char in animation_chars]
+        frame_widths = [fixed_width + char_width for char_width in char_widths]
+        frame_count = len(frames)
+
         idx = 0
-        last_char = animation_chars[0]
+        width = frame_widths[0]
+        next_tick = time.monotonic()
 
         while not self._stop_animation_event.is_set():
-            char = animation_chars[idx % len(animation_chars)]
-            last_char = char
-
-            line = f"{color}{message} {char}{TermColors.RESET} "
-            stripped_line = self._strip_ansi_codes(line)
-            width = self._wcswidth(stripped_line)
+            frame_idx = idx % frame_count
+            width = frame_widths[frame_idx]
 
             with self._animation_lock:
                 self._current_animation_line_width = width
 
-            sys.stdout.write(f"\r{line}")
+            sys.stdout.write(frames[frame_idx])
             sys.stdout.flush()
 
             idx += 1
-            time.sleep(0.12)
-
-        final_line = f"{color}{message} {last_char}{TermColors.RESET} "
-        stripped_final = self._strip_ansi_codes(final_line)
-        width = self._wcswidth(stripped_final)
+            # 按固定节拍调度，避免每帧累积漂移；停止时 wait 会立即返回
+            next_tick += self.ANIMATION_INTERVAL
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                next_tick = time.monotonic()
+                delay = 0
+            if self._stop_animation_event.wait(delay):
+                break
 
         sys.stdout.write("\r" + " " * width + "\r")
         sys.stdout.flush()
 
-    @staticmethod
-    def _strip_ansi_codes(text: str) -> str:
+    @classmethod
+    def _strip_ansi_codes(cls, text: str) -> str:
         """移除ANSI转义码"""
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return cls._ANSI_ESCAPE.sub('', text)
 
     @staticmethod
     def _wcswidth(s: str) -> int:
         """计算字符串显示宽度，非ASCII字符计为2"""
         if not isinstance(s, str):
             return len(s) if s else 0
-        return sum(2 if ord(c) > 127 else 1 for c in s)
+        if s.isascii():
+            return len(s)
+        # 非ASCII字符在 encode 时被丢弃，长度差就是宽字符的个数
+        return 2 * len(s) - len(s.encode('ascii', 'ignore'))
 
 
 class AnimationAwareStreamHandler(logging.StreamHandler):
@@ -304,16 +322,17 @@ class AnimationAwareStreamHandler(logging.StreamHandler):
             should_clear = logger._is_animating and logger._current_animation_line_width > 0
             width = logger._current_animation_line_width
 
-        if should_clear:
-            self.acquire()
-            try:
-                self.flush()
-                self.stream.write("\r" + " " * width + "\r")
-                self.stream.flush()
-            finally:
-                self.release()
-
-        super().emit(record)
+        # 清除动画行和日志内容合并成一次写入；Handler.handle 已经持有 self.lock
+        try:
+            msg = self.format(record) + self.terminator
+            if should_clear:
+                msg = "\r" + " " * width + "\r" + msg
+            self.stream.write(msg)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -322,27 +341,42 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, show_timestamp: bool):
         super().__init__(datefmt=Logger.DATE_FORMAT)
         self.show_timestamp = show_timestamp
+        # 每个级别的前缀是固定的，提前拼好，format 时只需查一次字典
+        self._level_prefixes = {
+            logging.INFO: f"{TermColors.GREEN}[INFO]: {TermColors.RESET}",
+            logging.WARNING: f"{TermColors.YELLOW}[WARNING]: {TermColors.RESET}",
+            logging.ERROR: f"{TermColors.RED}[ERROR]: {TermColors.RESET}",
+            logging.CRITICAL: f"[CRITICAL]: {TermColors.RESET}",
+        }
+        self._time_cache = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        """DATE_FORMAT 只精确到秒，同一秒内的记录复用上次的结果"""
+        if datefmt is None:
+            # 基类默认格式会附带毫秒，不能按秒缓存
+            return super().formatTime(record, datefmt)
+        key = (int(record.created), datefmt)
+        cached_key, cached_str = self._time_cache
+        if cached_key == key:
+            return cached_str
+        time_str = super().formatTime(record, datefmt)
+        self._time_cache = (key, time_str)
+        return time_str
 
     def format(self, record):
         if hasattr(record, 'is_animation_control') and record.is_animation_control:
             return record.getMessage()
 
-        timestamp = f"{self.formatTime(record, Logger.DATE_FORMAT)} " if self.show_timestamp else ""
-        
+        timestamp = f"{self.formatTime(record, self.datefmt)} " if self.show_timestamp else ""
         message = record.getMessage()
-        level = f"[{record.levelname}]: "
-        
+
         if record.levelno == logging.DEBUG:
-            return f"{TermColors.GREY}{timestamp}{level}{message}{TermColors.RESET}"
-        
-        color = ""
-        if record.levelno == logging.INFO:
-            color = TermColors.GREEN
-        elif record.levelno == logging.WARNING:
-            color = TermColors.YELLOW
-        elif record.levelno == logging.ERROR:
-            color = TermColors.RED
-            
-        return f"{timestamp}{color}{level}{TermColors.RESET}{message}"
+            return f"{TermColors.GREY}{timestamp}[DEBUG]: {message}{TermColors.RESET}"
+
+        prefix = self._level_prefixes.get(record.levelno)
+        if prefix is None:
+            prefix = f"[{record.levelname}]: {TermColors.RESET}"
+
+        return f"{timestamp}{prefix}{message}"
 
 logger = Logger()
\ No newline at end of file
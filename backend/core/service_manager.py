@@ -1,24 +1,39 @@
-from .ai_service import AIService
 from .logger import logger
 import os
+import threading
 
-class ServiceManager:
-    _instance = None
-    
+class Singleton(type):
+    """线程安全的单例元类，保证每个类只会被实例化一次"""
+    _instances = {}
+    _lock = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super().__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+class ServiceManager(metaclass=Singleton):
     def __init__(self):
         self.ai_service = None
-    
+        self._ai_service_lock = threading.Lock()
+
     def init_ai_service(self, settings):
+        # AIService 会加载模型，开销很大，并发初始化时也只能创建一次
         if self.ai_service is None:
-            self.ai_service = AIService(settings)
+            with self._ai_service_lock:
+                if self.ai_service is None:
+                    # 延迟导入：ai_service 会带入 torch/transformers 等重量级依赖，
+                    # 不需要 AI 的路由（背景、静态文件等）启动时不必付出这部分开销
+                    from .ai_service import AIService
+                    self.ai_service = AIService(settings)
         logger.info(f"🧠🧠🧠 ai_service 初始化")
 
         return self.ai_service
 
     @classmethod
     def get_instance(cls):
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return cls()
 
-service_manager = ServiceManager.get_instance()
\ No newline at end of file
+service_manager = ServiceManager()
@@ -1,9 +1,24 @@
 import re
 import os
+import shutil
 from datetime import datetime
 from typing import List, Dict
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 class Function:
+    @staticmethod
+    def save_upload_file(src, save_path):
+        """
+        把上传的文件对象写入磁盘，阻塞调用，路由里应通过 asyncio.to_thread 执行
+
+        Args:
+            src: 上传文件的文件对象（UploadFile.file）
+            save_path (Path): 保存路径
+        """
+        with open(save_path, "wb") as buffer:
+            shutil.copyfileobj(src, buffer, length=UPLOAD_CHUNK_SIZE)
+
     @staticmethod
     def detect_language(text):
         """
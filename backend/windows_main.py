@@ -17,14 +17,14 @@ try:
 
 ###################你应该把正式的导入写在这里###################
     import asyncio
-    from fastapi import FastAPI, Request
+    from fastapi import FastAPI
     from api.chat_music import router as chat_music_router
     from api.chat_history import router as chat_history_router
     from api.chat_info import router as chat_info_router
     from api.chat_character import router as chat_character_router
     from api.chat_background import router as chat_background_router
     from api.chat_main import websocket_endpoint
-    from api.frontend_routes import router as frontend_router, get_static_files
+    from api.frontend_routes import router as frontend_router, get_static_files, NoCacheMiddleware
     from api.env_config import router as env_config_router
     from core.server import Server
     from database.database import init_db
@@ -55,16 +55,7 @@ finally:
 
 app = FastAPI()
 
-@app.middleware("http")
-async def add_no_cache_headers(request: Request, call_next):
-    response = await call_next(request)
-    if not request.url.path.startswith("/api"):  # 排除API路由
-        response.headers.update({
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0"
-        })
-    return response
+app.add_middleware(NoCacheMiddleware)  # 非API路由禁用缓存
 
 # 注册路由
 logger.info("注册API路由...")